@@ -129,8 +129,8 @@ class PassiveObject(arcade.Sprite):
 
 
 class Column(PassiveObject):
-    def __init__(self, x, y, space):
-        super().__init__("assets/img/column.png", x, y, space)
+    def __init__(self, x, y, space, **kwargs):
+        super().__init__("assets/img/column.png", x, y, space, **kwargs)
 
 
 class StaticObject(arcade.Sprite):
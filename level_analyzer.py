@@ -0,0 +1,203 @@
+"""
+Level difficulty analyzer.
+
+Runs windowless simulations of every level over a grid of physics parameters
+with a sampled set of slingshot launches. Each (level, configuration) pair is
+simulated in a worker process and its summary row is written to a CSV file as
+soon as it finishes.
+
+Usage (from the repository root, so the asset paths resolve):
+    python level_analyzer.py --gravity -900 -700 --destroy-impulse 1000 1200
+"""
+import argparse
+import csv
+import inspect
+import itertools
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from game_logic import Point2D, get_impulse_vector
+from game_object import Bird, PassiveObject, Pig
+from main import (
+    DESTROY_IMPULSE,
+    GRAVITY,
+    SLING_RADIUS,
+    SLING_X,
+    build_level,
+    create_space,
+)
+
+# main configures DEBUG logging on import, the collision handler would flood the output
+logging.getLogger().setLevel(logging.WARNING)
+
+LAUNCH_Y = 150  # top of the slingshot texture
+TIME_STEP = 1 / 60.0  # same step as App.on_update
+BIRD_IMAGE = "assets/img/red-bird3.png"
+
+
+def _default(cls, name):
+    """Default value of a keyword argument of cls.__init__."""
+    return inspect.signature(cls.__init__).parameters[name].default
+
+
+# parameter name -> (class whose keyword it maps to, keyword, default value)
+PARAMETERS = {
+    "gravity": (None, None, GRAVITY),
+    "destroy_impulse": (None, None, DESTROY_IMPULSE),
+    "bird_mass": (Bird, "mass", _default(Bird, "mass")),
+    "bird_elasticity": (Bird, "elasticity", _default(Bird, "elasticity")),
+    "bird_friction": (Bird, "friction", _default(Bird, "friction")),
+    "max_impulse": (Bird, "max_impulse", _default(Bird, "max_impulse")),
+    "power_multiplier": (Bird, "power_multiplier", _default(Bird, "power_multiplier")),
+    "pig_mass": (Pig, "mass", _default(Pig, "mass")),
+    "pig_elasticity": (Pig, "elasticity", _default(Pig, "elasticity")),
+    "pig_friction": (Pig, "friction", _default(Pig, "friction")),
+    "column_mass": (PassiveObject, "mass", _default(PassiveObject, "mass")),
+    "column_elasticity": (PassiveObject, "elasticity", _default(PassiveObject, "elasticity")),
+    "column_friction": (PassiveObject, "friction", _default(PassiveObject, "friction")),
+}
+
+
+def _kwargs_for(cls, config: dict) -> dict:
+    """Keyword arguments of config that belong to the given class."""
+    return {
+        keyword: config[name]
+        for name, (owner, keyword, _) in PARAMETERS.items()
+        if owner is cls
+    }
+
+
+def sample_launches(count: int, seed: int, min_drag: float, max_drag: float, max_angle_deg: float) -> list[tuple[float, float]]:
+    """Random (elevation radians, drag distance px) pairs shared by every configuration."""
+    rng = np.random.default_rng(seed)
+    angles = rng.uniform(0.0, math.radians(max_angle_deg), count)
+    drags = rng.uniform(min_drag, max_drag, count)
+    return [(float(a), float(d)) for a, d in zip(angles, drags)]
+
+
+def simulate_shot(level_number: int, config: dict, angle: float, drag: float, seconds: float) -> tuple[int, int]:
+    """
+    Fire a single red bird at the given level and let the physics run.
+    Returns (pigs destroyed, pigs in the level).
+    """
+    space = create_space(config["gravity"])
+    columns, pigs = build_level(
+        level_number,
+        space,
+        column_kwargs=_kwargs_for(PassiveObject, config),
+        pig_kwargs=_kwargs_for(Pig, config),
+    )
+    world = columns + pigs
+
+    # same rule as App.collision_handler
+    def collision_handler(arbiter, space, data):
+        if arbiter.total_impulse.length <= config["destroy_impulse"]:
+            return True
+        for obj in world[:]:
+            if obj.shape in arbiter.shapes:
+                if isinstance(obj, Pig):
+                    obj.destroyed = True
+                world.remove(obj)
+                space.remove(obj.shape, obj.body)
+
+    handler = space.add_default_collision_handler()
+    handler.post_solve = collision_handler
+
+    # App.on_mouse_release spawns the bird at the release point, so the pull ends on the
+    # sling pouch and the press point sits `drag` px ahead of it along the launch direction
+    end_point = Point2D(SLING_X, LAUNCH_Y)
+    start_point = Point2D(SLING_X + drag * math.cos(angle), LAUNCH_Y + drag * math.sin(angle))
+    impulse_vector = get_impulse_vector(end_point, start_point)
+    Bird(BIRD_IMAGE, impulse_vector, end_point.x, end_point.y, space, **_kwargs_for(Bird, config))
+
+    for _ in range(int(seconds / TIME_STEP)):
+        space.step(TIME_STEP)
+        if all(pig.destroyed for pig in pigs):
+            break
+
+    return sum(pig.destroyed for pig in pigs), len(pigs)
+
+
+def analyze(level_number: int, config: dict, launches: list[tuple[float, float]], seconds: float) -> dict:
+    """Run every launch against one level / configuration and summarize it."""
+    solved = 0
+    destroyed_total = 0
+    pig_count = 0
+    for angle, drag in launches:
+        destroyed, pig_count = simulate_shot(level_number, config, angle, drag, seconds)
+        destroyed_total += destroyed
+        if destroyed == pig_count:
+            solved += 1
+
+    shots = len(launches)
+    return {
+        "level": level_number,
+        **config,
+        "pigs": pig_count,
+        "shots": shots,
+        "solvable_fraction": solved / shots if shots else 0.0,
+        "mean_pigs_destroyed": destroyed_total / shots if shots else 0.0,
+    }
+
+
+def parameter_grid(args: argparse.Namespace) -> list[dict]:
+    """Cartesian product of every value given for each parameter."""
+    names = list(PARAMETERS)
+    values = [getattr(args, name) for name in names]
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def run(args: argparse.Namespace):
+    # the game never clamps the pull, so by default sample up to the largest swept
+    # max_impulse, otherwise Bird's min(max_impulse, impulse) cap would hide that parameter
+    max_drag = args.max_drag if args.max_drag is not None else max(SLING_RADIUS, *args.max_impulse)
+    launches = sample_launches(args.shots, args.seed, args.min_drag, max_drag, args.max_angle)
+    configs = parameter_grid(args)
+    jobs = [(level, config) for level in args.levels for config in configs]
+    fieldnames = ["level", *PARAMETERS, "pigs", "shots", "solvable_fraction", "mean_pigs_destroyed"]
+    print(f"{len(jobs)} jobs, {len(launches)} shots each, {args.workers} workers")
+
+    with open(args.output, "w", newline="") as output, ProcessPoolExecutor(max_workers=args.workers) as pool:
+        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        writer.writeheader()
+        output.flush()
+
+        futures = [pool.submit(analyze, level, config, launches, args.seconds) for level, config in jobs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                row = future.result()
+            except Exception:
+                # don't let the pool's exit wait for the rest of the sweep
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            # stream each result so partial sweeps are usable
+            writer.writerow(row)
+            output.flush()
+            print(
+                f"[{done}/{len(jobs)}] level {row['level']}: "
+                f"solvable={row['solvable_fraction']:.2f} mean pigs={row['mean_pigs_destroyed']:.2f}"
+            )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sweep physics parameters and measure level difficulty.")
+    parser.add_argument("--levels", type=int, nargs="+", choices=[1, 2, 3], default=[1, 2, 3])
+    parser.add_argument("--shots", type=int, default=50, help="sampled launches per configuration")
+    parser.add_argument("--seconds", type=float, default=6.0, help="simulated time per shot")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-drag", type=float, default=20.0, help="shortest sampled slingshot pull (px)")
+    parser.add_argument("--max-drag", type=float, default=None, help="longest sampled slingshot pull (px), defaults to the largest --max-impulse")
+    parser.add_argument("--max-angle", type=float, default=80.0, help="highest sampled launch elevation (degrees)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", default="level_analysis.csv")
+    for name, (_, _, default) in PARAMETERS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, nargs="+", default=[default])
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -21,6 +21,117 @@ GROUND_Y = 50
 SLING_X = 200
 SLING_Y = GROUND_Y + 1  # a little above the ground
 SLING_RADIUS = 100        # max pull distance
+DESTROY_IMPULSE = 1200    # collision impulse needed to break an object
+
+
+def create_space(gravity: float = GRAVITY) -> pymunk.Space:
+    """Pymunk space with the floor and side walls of the level."""
+    space = pymunk.Space()
+    space.gravity = (0, gravity)
+
+    # floor
+    floor_body = pymunk.Body(body_type=pymunk.Body.STATIC)
+    floor_shape = pymunk.Segment(floor_body, [0, 15], [WIDTH, 15], 0.0)
+    floor_shape.friction = 10
+    space.add(floor_body, floor_shape)
+
+    #walls
+    static_body = space.static_body
+    height = HEIGHT
+    width = WIDTH
+
+    # Left wall
+    left_wall = pymunk.Segment(static_body, (0, 0), (0, height), 1)
+    left_wall.elasticity = 0.8
+    left_wall.friction = 1.0
+
+    # Right wall
+    right_wall = pymunk.Segment(static_body, (width, 0), (width, height), 1)
+    right_wall.elasticity = 0.2
+    right_wall.friction = 1.0
+
+    # Add to space
+    space.add(left_wall, right_wall)
+    return space
+
+
+def build_level(level_number: int, space: pymunk.Space, column_kwargs: dict | None = None, pig_kwargs: dict | None = None):
+    """
+    Create the columns and pigs of a level inside the given space.
+    Extra keyword arguments are forwarded to every Column / Pig.
+    Returns (columns, pigs).
+    """
+    column_kwargs = column_kwargs or {}
+    pig_kwargs = pig_kwargs or {}
+    columns = []
+    pigs = []
+
+    if level_number == 1:
+        base_x_positions = [700, 800, 900]  
+        column_height = 100  
+        pig_offset_y = 1   
+
+        for x in base_x_positions:
+            col = Column(x, GROUND_Y + column_height / 2, space, **column_kwargs)
+            columns.append(col)
+
+            pig_y = GROUND_Y + column_height + pig_offset_y
+            pig = Pig(x, pig_y, space, **pig_kwargs)
+            pigs.append(pig)
+
+    elif level_number == 2:
+        positions = [
+            (750, 100), 
+            (850, 100),
+            (950, 100), 
+            (1050, 100),
+            (1150, 100)
+        ]
+        pig_offset_y = 1
+        for x, col_y in positions:
+            col = Column(x, col_y, space, **column_kwargs)
+            columns.append(col)
+
+            pig_y = col_y + 50 + pig_offset_y
+            pig = Pig(x, pig_y, space, **pig_kwargs)
+            pigs.append(pig)
+
+    elif level_number == 3:
+        column_height = 120
+        pig_offset_y = 1
+        base_x_left = 650
+        
+        for i in range(2):
+            col_y = GROUND_Y + i * column_height
+            col = Column(base_x_left, col_y, space, **column_kwargs)
+            columns.append(col)
+        
+        positions = [
+            (750, 100), 
+            (850, 100),
+            (950, 100), 
+            (1050, 100),
+            (1150, 100)
+        ]
+        
+        for x, col_y in positions:
+            col = Column(x, col_y, space, **column_kwargs)
+            columns.append(col)
+
+            pig_y = col_y + 50 + pig_offset_y
+            pig = Pig(x, pig_y, space, **pig_kwargs)
+            pigs.append(pig)
+
+        base_x_right = 1250
+        for i in range(2):
+            col_y = GROUND_Y + i * column_height
+            col = Column(base_x_right, col_y, space, **column_kwargs)
+            columns.append(col)
+
+    else:
+        raise ValueError(f"Unknown level: {level_number}")
+
+    return columns, pigs
 
 
 class App(arcade.View):
@@ -28,33 +139,8 @@ class App(arcade.View):
         super().__init__()
         self.background = arcade.load_texture("assets/img/background3.png")
         self.sling_texture = arcade.load_texture("assets/img/sling-3.png")
-        # creating pymunk space
-        self.space = pymunk.Space()
-        self.space.gravity = (0, GRAVITY)
-
-        # floor
-        floor_body = pymunk.Body(body_type=pymunk.Body.STATIC)
-        floor_shape = pymunk.Segment(floor_body, [0, 15], [WIDTH, 15], 0.0)
-        floor_shape.friction = 10
-        self.space.add(floor_body, floor_shape)
-        
-        #walls
-        static_body = self.space.static_body
-        height = HEIGHT  
-        width = WIDTH    
-
-        # Left wall
-        left_wall = pymunk.Segment(static_body, (0, 0), (0, height), 1)
-        left_wall.elasticity = 0.8
-        left_wall.friction = 1.0
-
-        # Right wall
-        right_wall = pymunk.Segment(static_body, (width, 0), (width, height), 1)
-        right_wall.elasticity = 0.2
-        right_wall.friction = 1.0
-
-        # Add to space
-        self.space.add(left_wall, right_wall)
+        # creating pymunk space with floor and walls
+        self.space = create_space()
 
         self.sprites = arcade.SpriteList()
         self.birds = arcade.SpriteList()
@@ -96,7 +182,7 @@ class App(arcade.View):
         if impulse_norm < 100:
             return True
         logger.debug(impulse_norm)
-        if impulse_norm > 1200:
+        if impulse_norm > DESTROY_IMPULSE:
             for obj in self.world:
                 if obj.shape in arbiter.shapes:
                     if isinstance(obj, Pig) and not obj.destroyed:
@@ -216,67 +302,7 @@ class App(arcade.View):
     # Clear previous level objects
         self.clear_level()
 
-        if level_number == 1:
-            base_x_positions = [700, 800, 900]  
-            column_height = 100  
-            pig_offset_y = 1   
-
-            for x in base_x_positions:
-                col = Column(x, GROUND_Y + column_height / 2, self.space)
-                self.columns.append(col)
-
-                pig_y = GROUND_Y + column_height + pig_offset_y
-                pig = Pig(x, pig_y, self.space)
-                self.pigs.append(pig)
-
-        elif level_number == 2:
-            positions = [
-                (750, 100), 
-                (850, 100),
-                (950, 100), 
-                (1050, 100),
-                (1150, 100)
-            ]
-            pig_offset_y = 1
-            for x, col_y in positions:
-                col = Column(x, col_y, self.space)
-                self.columns.append(col)
-
-                pig_y = col_y + 50 + pig_offset_y
-                pig = Pig(x, pig_y, self.space)
-                self.pigs.append(pig)
-
-        elif level_number == 3:
-            column_height = 120
-            pig_offset_y = 1
-            base_x_left = 650
-            
-            for i in range(2):
-                col_y = GROUND_Y + i * column_height
-                col = Column(base_x_left, col_y, self.space)
-                self.columns.append(col)
-            
-            positions = [
-                (750, 100), 
-                (850, 100),
-                (950, 100), 
-                (1050, 100),
-                (1150, 100)
-            ]
-            
-            for x, col_y in positions:
-                col = Column(x, col_y, self.space)
-                self.columns.append(col)
-
-                pig_y = col_y + 50 + pig_offset_y
-                pig = Pig(x, pig_y, self.space)
-                self.pigs.append(pig)
-
-            base_x_right = 1250
-            for i in range(2):
-                col_y = GROUND_Y + i * column_height
-                col = Column(base_x_right, col_y, self.space)
-                self.columns.append(col)
+        self.columns, self.pigs = build_level(level_number, self.space)
 
         # adding all objects to sprites and world lists
         for col in self.columns:
@@ -0,0 +1,54 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pymunk")
+pytest.importorskip("arcade")
+
+import level_analyzer  # noqa: E402
+
+
+def sweep(tmp_path, monkeypatch, *extra):
+    """Run a tiny sweep of level 1 and return its CSV rows."""
+    # asset paths are relative to the repository root
+    monkeypatch.chdir(Path(__file__).parent)
+    output = tmp_path / "analysis.csv"
+    args = level_analyzer.parse_args(
+        ["--levels", "1", "--shots", "3", "--seconds", "1", "--workers", "1", "--output", str(output), *extra]
+    )
+    level_analyzer.run(args)
+    with open(output, newline="") as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == [
+            "level", *level_analyzer.PARAMETERS, "pigs", "shots", "solvable_fraction", "mean_pigs_destroyed"
+        ]
+        return list(reader)
+
+
+def test_sweep_writes_one_row_per_configuration(tmp_path, monkeypatch):
+    rows = sweep(tmp_path, monkeypatch, "--gravity", "-900", "-700")
+    assert len(rows) == 2
+    for row in rows:
+        assert 0.0 <= float(row["solvable_fraction"]) <= 1.0
+        assert 0.0 <= float(row["mean_pigs_destroyed"]) <= int(row["pigs"])
+
+
+def test_destroy_impulse_changes_results(tmp_path, monkeypatch):
+    rows = sweep(tmp_path, monkeypatch, "--destroy-impulse", "0", "1e12")
+    by_threshold = {float(row["destroy_impulse"]): row for row in rows}
+    # any resting contact breaks everything vs. nothing ever breaks
+    assert float(by_threshold[0]["solvable_fraction"]) == 1.0
+    assert float(by_threshold[1e12]["mean_pigs_destroyed"]) == 0.0
+
+
+def test_gravity_changes_results(tmp_path, monkeypatch):
+    rows = sweep(tmp_path, monkeypatch, "--gravity", "-900", "-90000")
+    by_gravity = {float(row["gravity"]): row for row in rows}
+    assert float(by_gravity[-90000]["mean_pigs_destroyed"]) > float(by_gravity[-900]["mean_pigs_destroyed"])
+
+
+def test_unknown_level_is_rejected():
+    with pytest.raises(SystemExit):
+        level_analyzer.parse_args(["--levels", "4"])